@@ -8,7 +8,7 @@ from pygame.locals import *
 
 # Import extracted modules
 from ui.speech_handler import SpeechHandler, cytolk_available, tolk
-from models.celestial_object import CelestialObject
+from models.celestial_object import CelestialObject, CelestialObjectPool
 from models.celestial_database import CelestialDatabase
 from engine.navigation_controller import NavigationController
 from engine.config_manager import ConfigManager, UserMode, DistanceUnit
@@ -305,12 +305,13 @@ def fetch_celestial_objects():
 # get_next_object is now NavigationController.get_next_spatial_object()
 
 # Function to fetch celestial objects data periodically
-def data_fetch_thread(celestial_objects, lock, speech_queue):
+def data_fetch_thread(celestial_objects, objects_state, lock, speech_queue):
     while True:
         fetched_objects = fetch_celestial_objects()
         with lock:
             celestial_objects.clear()
             celestial_objects.extend(fetched_objects)
+            objects_state['version'] += 1
         # Announce update
         speech_queue.put("Celestial data updated.")
         time.sleep(3600)  # Update every hour
@@ -356,6 +357,8 @@ def main():
     # Initialize celestial objects list
     celestial_objects = []
     filtered_objects = []  # Filtered subset based on filter_mode
+    # Bumped (under lock) whenever celestial_objects is replaced
+    objects_state = {'version': 0}
 
     # Initialize threading lock
     lock = threading.Lock()
@@ -390,6 +393,7 @@ def main():
             with lock:
                 celestial_objects.clear()
                 celestial_objects.extend(cached_objects)
+                objects_state['version'] += 1
                 filtered_objects.clear()
                 filtered_objects.extend(celestial_objects)
 
@@ -403,6 +407,7 @@ def main():
             with lock:
                 celestial_objects.clear()
                 celestial_objects.extend(fetched_objects)
+                objects_state['version'] += 1
                 filtered_objects.clear()
                 filtered_objects.extend(celestial_objects)
 
@@ -471,7 +476,7 @@ def main():
     initial_fetch_thread.start()
 
     # Start periodic data fetching in a separate thread
-    data_thread = threading.Thread(target=data_fetch_thread, args=(celestial_objects, lock, speech_queue), daemon=True)
+    data_thread = threading.Thread(target=data_fetch_thread, args=(celestial_objects, objects_state, lock, speech_queue), daemon=True)
     data_thread.start()
 
     # Initialize navigation controller
@@ -485,6 +490,10 @@ def main():
     selected_object = None
     first_selection_made = False
 
+    # Vectorized position updates (built lazily from celestial_objects)
+    position_pool = None
+    position_pool_version = None
+
     # Space weather monitoring
     space_weather_warnings = []  # Store current warnings
     space_weather_lock = threading.Lock()  # Protect warnings list
@@ -735,9 +744,10 @@ def main():
                                 mods = pygame.key.get_mods()
                                 if mods & KMOD_SHIFT:
                                     # Shift+B: Announce current bookmarks
-                                    if config_manager.bookmarks:
-                                        speech_queue.put(f"Current bookmarks: {len(config_manager.bookmarks)} saved.")
-                                        for slot, name in sorted(config_manager.bookmarks.items()):
+                                    saved_bookmarks = config_manager.get_saved_bookmarks()
+                                    if saved_bookmarks:
+                                        speech_queue.put(f"Current bookmarks: {len(saved_bookmarks)} saved.")
+                                        for slot, name in saved_bookmarks:
                                             slot_display = slot if slot != 0 else 10
                                             speech_queue.put(f"Slot {slot_display}: {name}")
                                     else:
@@ -1061,8 +1071,11 @@ def main():
             # Update positions of celestial objects if dynamic mode is enabled
             if config_manager.dynamic_positions:
                 with lock:
-                    for obj in celestial_objects:
-                        obj.update_position(config_manager.time_scale)
+                    # Rebuild the kinematics pool whenever the object list is replaced
+                    if position_pool_version != objects_state['version']:
+                        position_pool = CelestialObjectPool(celestial_objects)
+                        position_pool_version = objects_state['version']
+                    position_pool.step(config_manager.time_scale)
 
             # Render
             SCREEN.fill(BLACK)
@@ -23,6 +23,11 @@ class AudioEngine:
         """
         self.sample_rate = sample_rate
         self.max_distance = 40.0  # Maximum distance in AU for normalization
+
+        # 20ms fade-in/out envelope shared by every generated tone
+        self._fade_samples = int(sample_rate * 0.02)
+        self._fade_in = np.linspace(0, 1, self._fade_samples)
+        self._fade_out = self._fade_in[::-1].copy()
         self.enable_cache = enable_cache
 
         # Audio cache: key -> pygame.mixer.Sound
@@ -110,12 +115,9 @@ class AudioEngine:
         audio = np.sin(freq * t * 2 * np.pi)
 
         # Apply fade-in and fade-out envelope to prevent clicks
-        fade_samples = int(self.sample_rate * 0.02)  # 20ms fade
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
-
-        audio[:fade_samples] *= fade_in
-        audio[-fade_samples:] *= fade_out
+        fade_samples = self._fade_samples
+        audio[:fade_samples] *= self._fade_in
+        audio[-fade_samples:] *= self._fade_out
 
         return audio
 
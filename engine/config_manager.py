@@ -10,12 +10,20 @@ from enum import Enum
 from pathlib import Path
 
 
+# Resolved once at import; Nuitka exposes __compiled__ as a module global
+if getattr(sys, 'frozen', False) or '__compiled__' in dir():
+    BASE_PATH = Path(os.path.dirname(sys.executable))
+else:
+    BASE_PATH = Path(__file__).parent.parent
+
+
 def get_base_path():
     """Get the base path for data files, handling both dev and compiled scenarios."""
-    if getattr(sys, 'frozen', False) or '__compiled__' in dir():
-        return Path(os.path.dirname(sys.executable))
-    else:
-        return Path(__file__).parent.parent
+    return BASE_PATH
+
+
+# Set ASA_PRETTY_CONFIG=1 to write an indented config.json (for hand editing)
+PRETTY_CONFIG = os.environ.get('ASA_PRETTY_CONFIG') == '1'
 
 
 class UserMode(Enum):
@@ -32,6 +40,103 @@ class DistanceUnit(Enum):
     MILES = "miles"     # Miles
 
 
+# Magnitude tables for spoken numbers: (threshold, divisor, format spec, suffix),
+# checked top to bottom; the last row catches everything below the others.
+_KM_SCALES = (
+    (1e9, 1e9, '.2f', 'billion km'),
+    (1e6, 1e6, '.2f', 'million km'),
+    (float('-inf'), 1, ',.0f', 'km'),
+)
+_MILE_SCALES = (
+    (1e9, 1e9, '.2f', 'billion miles'),
+    (1e6, 1e6, '.2f', 'million miles'),
+    (float('-inf'), 1, ',.0f', 'miles'),
+)
+_SPEED_SCALES = (  # km/s
+    (1000, 1000, '.2f', 'thousand km/s'),
+    (1, 1, '.2f', 'km/s'),
+    (float('-inf'), 0.001, '.1f', 'm/s'),
+)
+
+
+def _format_scaled(value, scales):
+    """Format value with the first matching row of a magnitude table."""
+    for threshold, divisor, spec, suffix in scales:
+        if value >= threshold:
+            return f"{value / divisor:{spec}} {suffix}"
+    # NaN compares false against every threshold; format it with the last row
+    _, divisor, spec, suffix = scales[-1]
+    return f"{value / divisor:{spec}} {suffix}"
+
+
+# Announcement builders, one per verbosity level. ConfigManager picks the
+# right set whenever the mode changes so the hot path skips the if/elif chain.
+_TYPE_DESCRIPTIONS = {
+    "Planet": "Planets are large celestial bodies that orbit stars.",
+    "Dwarf Planet": "Dwarf planets are celestial bodies similar to planets but smaller.",
+    "Asteroid": "Asteroids are rocky objects that orbit the Sun.",
+    "Comet": "Comets are icy objects that develop tails when near the Sun.",
+    "Spacecraft": "Spacecraft are human-made vehicles exploring space.",
+}
+
+
+def _announce_verbose(type_, name, distance_str):
+    # Educational mode: Detailed, explanatory
+    description = _TYPE_DESCRIPTIONS.get(type_, "This is a celestial object.")
+    return (
+        f"This is a {type_} named {name}. "
+        f"{description} "
+        f"It is located {distance_str} from the Sun. "
+        f"Use arrow keys to explore nearby objects, or press J to open the jump menu."
+    )
+
+
+def _announce_balanced(type_, name, distance_str):
+    # Exploration mode: Current behavior (moderate)
+    return f"{type_}: {name}, Distance: {distance_str}."
+
+
+def _announce_concise(type_, name, distance_str):
+    # Advanced mode: Minimal, technical
+    return f"{name}, {distance_str}, {type_}"
+
+
+def _selection_verbose(obj, fmt):
+    return (
+        f"Selected: {obj.type} {obj.name}. "
+        f"Distance: {fmt(obj.distance)}. "
+        f"Press Enter to jump to this object."
+    )
+
+
+def _selection_balanced(obj, fmt):
+    return f"Selected: {obj.type} {obj.name}, Distance: {fmt(obj.distance)}."
+
+
+def _selection_concise(obj, fmt):
+    return f"{obj.name}, {fmt(obj.distance)}"
+
+
+def _relative_verbose(obj1, obj2, distance_str):
+    return f"{obj1.name} is {distance_str} away from {obj2.name}."
+
+
+def _relative_balanced(obj1, obj2, distance_str):
+    return f"Distance from {obj1.name} to {obj2.name}: {distance_str}."
+
+
+def _relative_concise(obj1, obj2, distance_str):
+    return f"{obj1.name} to {obj2.name}: {distance_str}"
+
+
+# verbosity -> (announcement, selection, relative distance)
+_VERBOSITY_TEMPLATES = {
+    'verbose': (_announce_verbose, _selection_verbose, _relative_verbose),
+    'balanced': (_announce_balanced, _selection_balanced, _relative_balanced),
+    'concise': (_announce_concise, _selection_concise, _relative_concise),
+}
+
+
 class ConfigManager:
     """Manages user preferences and mode-specific settings."""
 
@@ -40,14 +145,21 @@ class ConfigManager:
     AU_TO_MILES = 92955807.3
     AU_PER_DAY_TO_KM_PER_SEC = AU_TO_KM / 86400  # Convert AU/day to km/s
 
+    # Fixed attribute layout (no per-instance __dict__)
+    __slots__ = (
+        "config_file", "user_mode", "time_scale", "dynamic_positions",
+        "distance_unit", "bookmarks", "zoom_level", "master_volume",
+        "mode_configs", "_distance_formatter", "_announce_template_fn",
+        "_selection_fn", "_relative_fn",
+    )
+
     def __init__(self, config_file="config.json"):
-        base_path = get_base_path()
-        self.config_file = base_path / config_file
+        self.config_file = BASE_PATH / config_file
         self.user_mode = UserMode.EXPLORATION  # Default mode
         self.time_scale = 365.0  # Days per second (default: 1 year per second)
         self.dynamic_positions = True  # Enable dynamic position updates
         self.distance_unit = DistanceUnit.AU  # Default distance unit
-        self.bookmarks = {}  # Persistent bookmarks: {slot_number: object_name}
+        self.bookmarks = [None] * 10  # Persistent bookmarks: index = slot number, value = object name
         self.zoom_level = 1.0  # Visualization zoom (0.1 to 10.0)
         self.master_volume = 1.0  # Master volume (0.0 to 1.0)
 
@@ -78,11 +190,26 @@ class ConfigManager:
 
         # Load saved preferences if they exist
         self.load_preferences()
+        self._refresh_mode_cache()
 
     def get_current_config(self):
         """Get the configuration for the current mode."""
         return self.mode_configs[self.user_mode]
 
+    def _refresh_mode_cache(self):
+        """Bind the formatter and announcement builders for the current mode and unit."""
+        if self.distance_unit == DistanceUnit.AU:
+            self._distance_formatter = self._format_au
+        elif self.distance_unit == DistanceUnit.KM:
+            self._distance_formatter = self._format_km
+        else:  # MILES
+            self._distance_formatter = self._format_miles
+
+        verbosity = self.get_current_config()['announcement_verbosity']
+        (self._announce_template_fn,
+         self._selection_fn,
+         self._relative_fn) = _VERBOSITY_TEMPLATES[verbosity]
+
     def format_distance(self, distance_au):
         """
         Format distance in the current unit.
@@ -93,25 +220,17 @@ class ConfigManager:
         Returns:
             Formatted distance string with unit
         """
-        if self.distance_unit == DistanceUnit.AU:
-            # Space between A and U so screen readers don't say "Australian dollars"
-            return f"{distance_au:.2f} A U"
-        elif self.distance_unit == DistanceUnit.KM:
-            distance_km = distance_au * self.AU_TO_KM
-            if distance_km >= 1e9:
-                return f"{distance_km / 1e9:.2f} billion km"
-            elif distance_km >= 1e6:
-                return f"{distance_km / 1e6:.2f} million km"
-            else:
-                return f"{distance_km:,.0f} km"
-        else:  # MILES
-            distance_miles = distance_au * self.AU_TO_MILES
-            if distance_miles >= 1e9:
-                return f"{distance_miles / 1e9:.2f} billion miles"
-            elif distance_miles >= 1e6:
-                return f"{distance_miles / 1e6:.2f} million miles"
-            else:
-                return f"{distance_miles:,.0f} miles"
+        return self._distance_formatter(distance_au)
+
+    def _format_au(self, distance_au):
+        # Space between A and U so screen readers don't say "Australian dollars"
+        return f"{distance_au:.2f} A U"
+
+    def _format_km(self, distance_au):
+        return _format_scaled(distance_au * self.AU_TO_KM, _KM_SCALES)
+
+    def _format_miles(self, distance_au):
+        return _format_scaled(distance_au * self.AU_TO_MILES, _MILE_SCALES)
 
     def format_speed(self, vx, vy, vz):
         """
@@ -129,12 +248,7 @@ class ConfigManager:
         # Convert to km/s (more intuitive)
         speed_km_s = speed_au_day * self.AU_PER_DAY_TO_KM_PER_SEC
 
-        if speed_km_s >= 1000:
-            return f"{speed_km_s / 1000:.2f} thousand km/s"
-        elif speed_km_s >= 1:
-            return f"{speed_km_s:.2f} km/s"
-        else:
-            return f"{speed_km_s * 1000:.1f} m/s"
+        return _format_scaled(speed_km_s, _SPEED_SCALES)
 
     def cycle_distance_unit(self):
         """Cycle through distance units: AU -> km -> miles -> AU."""
@@ -142,6 +256,7 @@ class ConfigManager:
         current_index = units.index(self.distance_unit)
         next_index = (current_index + 1) % len(units)
         self.distance_unit = units[next_index]
+        self._refresh_mode_cache()
         self.save_preferences()
         return self.distance_unit
 
@@ -173,63 +288,14 @@ class ConfigManager:
         Returns:
             Formatted announcement string based on current mode
         """
-        verbosity = self.get_current_config()['announcement_verbosity']
-        distance_str = self.format_distance(celestial_object.distance)
-
-        if verbosity == 'verbose':
-            # Educational mode: Detailed, explanatory
-            type_descriptions = {
-                "Planet": "Planets are large celestial bodies that orbit stars.",
-                "Dwarf Planet": "Dwarf planets are celestial bodies similar to planets but smaller.",
-                "Asteroid": "Asteroids are rocky objects that orbit the Sun.",
-                "Comet": "Comets are icy objects that develop tails when near the Sun.",
-                "Spacecraft": "Spacecraft are human-made vehicles exploring space.",
-            }
-
-            description = type_descriptions.get(celestial_object.type, "This is a celestial object.")
-
-            announcement = (
-                f"This is a {celestial_object.type} named {celestial_object.name}. "
-                f"{description} "
-                f"It is located {distance_str} from the Sun. "
-                f"Use arrow keys to explore nearby objects, or press J to open the jump menu."
-            )
-
-        elif verbosity == 'balanced':
-            # Exploration mode: Current behavior (moderate)
-            announcement = (
-                f"{celestial_object.type}: {celestial_object.name}, "
-                f"Distance: {distance_str}."
-            )
-
-        else:  # concise
-            # Advanced mode: Minimal, technical
-            announcement = (
-                f"{celestial_object.name}, "
-                f"{distance_str}, "
-                f"{celestial_object.type}"
-            )
-
-        return announcement
+        return self._announce_template_fn(
+            celestial_object.type, celestial_object.name,
+            self._distance_formatter(celestial_object.distance)
+        )
 
     def get_selection_announcement(self, celestial_object):
         """Get announcement for when an object is selected in jump mode."""
-        verbosity = self.get_current_config()['announcement_verbosity']
-        distance_str = self.format_distance(celestial_object.distance)
-
-        if verbosity == 'verbose':
-            return (
-                f"Selected: {celestial_object.type} {celestial_object.name}. "
-                f"Distance: {distance_str}. "
-                f"Press Enter to jump to this object."
-            )
-        elif verbosity == 'balanced':
-            return (
-                f"Selected: {celestial_object.type} {celestial_object.name}, "
-                f"Distance: {distance_str}."
-            )
-        else:  # concise
-            return f"{celestial_object.name}, {distance_str}"
+        return self._selection_fn(celestial_object, self._distance_formatter)
 
     def get_velocity_announcement(self, celestial_object):
         """
@@ -273,16 +339,7 @@ class ConfigManager:
         dz = obj1.z - obj2.z
         distance_au = (dx**2 + dy**2 + dz**2) ** 0.5
 
-        distance_str = self.format_distance(distance_au)
-
-        verbosity = self.get_current_config()['announcement_verbosity']
-
-        if verbosity == 'verbose':
-            return f"{obj1.name} is {distance_str} away from {obj2.name}."
-        elif verbosity == 'balanced':
-            return f"Distance from {obj1.name} to {obj2.name}: {distance_str}."
-        else:  # concise
-            return f"{obj1.name} to {obj2.name}: {distance_str}"
+        return self._relative_fn(obj1, obj2, self._distance_formatter(distance_au))
 
     def get_audio_params(self):
         """
@@ -306,6 +363,7 @@ class ConfigManager:
         current_index = modes.index(self.user_mode)
         next_index = (current_index + 1) % len(modes)
         self.user_mode = modes[next_index]
+        self._refresh_mode_cache()
 
         # Save preference
         self.save_preferences()
@@ -391,18 +449,58 @@ class ConfigManager:
                 'time_scale': self.time_scale,
                 'dynamic_positions': self.dynamic_positions,
                 'distance_unit': self.distance_unit.value,
-                'bookmarks': self.bookmarks,  # {slot: object_name}
+                'bookmarks': self.bookmarks,  # [object_name or None] indexed by slot
                 'zoom_level': self.zoom_level,
                 'master_volume': self.master_volume,
             }
 
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            with open(self.config_file, 'w', buffering=16384) as f:
+                if PRETTY_CONFIG:
+                    json.dump(config_data, f, indent=2)
+                else:
+                    json.dump(config_data, f, separators=(',', ':'))
 
             logging.info(f"Preferences saved to {self.config_file}")
         except Exception as e:
             logging.error(f"Failed to save preferences: {e}")
 
+    @staticmethod
+    def _parse_bookmarks(raw_bookmarks):
+        """
+        Turn saved bookmarks into the 10-slot list, skipping anything invalid.
+
+        Args:
+            raw_bookmarks: Saved list of 10 names/None, or the older {"slot": name} dict
+
+        Returns:
+            List of 10 object names or None
+        """
+        bookmarks = [None] * 10
+        if isinstance(raw_bookmarks, dict):
+            items = raw_bookmarks.items()
+        elif isinstance(raw_bookmarks, list):
+            if len(raw_bookmarks) != 10:
+                logging.warning(f"Expected 10 bookmark slots, found {len(raw_bookmarks)}; padding/truncating")
+            items = enumerate(raw_bookmarks[:10])
+        else:
+            logging.warning(f"Ignoring bookmarks of unexpected type {type(raw_bookmarks).__name__}")
+            return bookmarks
+
+        for slot, name in items:
+            try:
+                slot = int(slot)
+            except (TypeError, ValueError):
+                logging.warning(f"Ignoring bookmark with invalid slot {slot!r}")
+                continue
+            if not 0 <= slot <= 9:
+                logging.warning(f"Ignoring bookmark in out-of-range slot {slot}")
+                continue
+            if name is not None and not isinstance(name, str):
+                logging.warning(f"Ignoring invalid bookmark in slot {slot}: {name!r}")
+                continue
+            bookmarks[slot] = name
+        return bookmarks
+
     def load_preferences(self):
         """Load preferences from config file if it exists."""
         try:
@@ -432,9 +530,8 @@ class ConfigManager:
                 except ValueError:
                     self.distance_unit = DistanceUnit.AU
 
-                # Load bookmarks (convert string keys to int)
-                raw_bookmarks = config_data.get('bookmarks', {})
-                self.bookmarks = {int(k): v for k, v in raw_bookmarks.items()}
+                # Load bookmarks
+                self.bookmarks = self._parse_bookmarks(config_data.get('bookmarks', []))
 
                 # Load zoom level
                 self.zoom_level = config_data.get('zoom_level', 1.0)
@@ -444,8 +541,9 @@ class ConfigManager:
 
                 logging.info(f"Time scale: {self.time_scale} days/sec, Dynamic: {self.dynamic_positions}")
                 logging.info(f"Distance unit: {self.distance_unit.value}, Zoom: {self.zoom_level}")
-                if self.bookmarks:
-                    logging.info(f"Loaded {len(self.bookmarks)} bookmarks")
+                bookmark_count = 10 - self.bookmarks.count(None)
+                if bookmark_count:
+                    logging.info(f"Loaded {bookmark_count} bookmarks")
         except Exception as e:
             logging.error(f"Failed to load preferences: {e}")
             # Continue with defaults
@@ -478,24 +576,26 @@ class ConfigManager:
         Returns:
             Object name or None if slot empty
         """
-        return self.bookmarks.get(slot)
+        if 0 <= slot <= 9:
+            return self.bookmarks[slot]
+        return None
+
+    def get_saved_bookmarks(self):
+        """Get (slot, object_name) pairs for all filled bookmark slots, in slot order."""
+        return [(slot, name) for slot, name in enumerate(self.bookmarks) if name is not None]
 
     def clear_bookmark(self, slot):
         """Clear a bookmark slot."""
-        if slot in self.bookmarks:
-            del self.bookmarks[slot]
+        if 0 <= slot <= 9 and self.bookmarks[slot] is not None:
+            self.bookmarks[slot] = None
             self.save_preferences()
             return True
         return False
 
     def get_next_available_slot(self):
         """Get next available bookmark slot (1-9, then 0)."""
-        for i in range(1, 10):
-            if i not in self.bookmarks:
-                return i
-        if 0 not in self.bookmarks:
-            return 0
-        return None  # All slots full
+        # Search slots 1-9 first, then fall back to slot 0 (slot 10)
+        return next((i for i in (1, 2, 3, 4, 5, 6, 7, 8, 9, 0) if self.bookmarks[i] is None), None)
 
     # Zoom control methods
     def zoom_in(self, factor=1.25):
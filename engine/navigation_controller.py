@@ -6,6 +6,8 @@ Navigation controller for spatial and list-based navigation.
 class NavigationController:
     """Manages navigation state and object selection."""
 
+    __slots__ = ("navigation_mode", "selected_index", "jump_mode_index")
+
     def __init__(self):
         self.navigation_mode = 'spatial'  # 'spatial' or 'jump'
         self.selected_index = 0
@@ -40,39 +42,31 @@ class NavigationController:
         if current_index is None or current_index < 0 or current_index >= len(celestial_objects):
             return None
 
-        current_obj = celestial_objects[current_index]
-        candidates = []
-
-        for idx, obj in enumerate(celestial_objects):
-            if direction == 'left' and obj.screen_pos[0] < current_obj.screen_pos[0]:
-                candidates.append((idx, obj))
-            elif direction == 'right' and obj.screen_pos[0] > current_obj.screen_pos[0]:
-                candidates.append((idx, obj))
-            elif direction == 'up' and obj.screen_pos[1] < current_obj.screen_pos[1]:
-                candidates.append((idx, obj))
-            elif direction == 'down' and obj.screen_pos[1] > current_obj.screen_pos[1]:
-                candidates.append((idx, obj))
+        cx, cy = celestial_objects[current_index].screen_pos
+        best_idx = None
+        best_gap = float('inf')
 
-        if not candidates:
-            return current_index  # No movement
+        # Single pass: track the nearest object strictly beyond the current one
+        # along the requested axis (no candidate list, no sort)
+        if direction == 'left':
+            for idx, obj in enumerate(celestial_objects):
+                gap = cx - obj.screen_pos[0]
+                if 0 < gap < best_gap:
+                    best_idx, best_gap = idx, gap
+        elif direction == 'right':
+            for idx, obj in enumerate(celestial_objects):
+                gap = obj.screen_pos[0] - cx
+                if 0 < gap < best_gap:
+                    best_idx, best_gap = idx, gap
+        elif direction == 'up':
+            for idx, obj in enumerate(celestial_objects):
+                gap = cy - obj.screen_pos[1]
+                if 0 < gap < best_gap:
+                    best_idx, best_gap = idx, gap
+        elif direction == 'down':
+            for idx, obj in enumerate(celestial_objects):
+                gap = obj.screen_pos[1] - cy
+                if 0 < gap < best_gap:
+                    best_idx, best_gap = idx, gap
 
-        if direction in ['left', 'right']:
-            # Sort candidates based on x-coordinate
-            if direction == 'left':
-                # Closest to current x, i.e., largest x < current x
-                candidates.sort(key=lambda x: x[1].screen_pos[0], reverse=True)
-            else:
-                # 'right' - smallest x > current x
-                candidates.sort(key=lambda x: x[1].screen_pos[0])
-            return candidates[0][0]
-        elif direction in ['up', 'down']:
-            # Sort candidates based on y-coordinate
-            if direction == 'up':
-                # Closest to current y, i.e., largest y < current y
-                candidates.sort(key=lambda x: x[1].screen_pos[1], reverse=True)
-            else:
-                # 'down' - smallest y > current y
-                candidates.sort(key=lambda x: x[1].screen_pos[1])
-            return candidates[0][0]
-        else:
-            return current_index
+        return best_idx if best_idx is not None else current_index  # No movement if nothing found
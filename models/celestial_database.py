@@ -2,45 +2,116 @@
 Celestial object database and catalog.
 Loads from JSON catalog and supports dynamic querying of NASA APIs.
 """
-import json
+import itertools
 import logging
+import pickle
 import sys
 import os
+from collections import Counter, defaultdict
 from pathlib import Path
 
+import orjson
+
+
+# Resolved once at import; Nuitka exposes __compiled__ as a module global
+if getattr(sys, 'frozen', False) or '__compiled__' in dir():
+    BASE_PATH = Path(os.path.dirname(sys.executable))
+else:
+    BASE_PATH = Path(__file__).parent.parent
+
 
 def get_base_path():
     """Get the base path for data files, handling both dev and compiled scenarios."""
-    # Check if running as compiled Nuitka executable
-    if getattr(sys, 'frozen', False) or '__compiled__' in dir():
-        # Running as compiled - use executable directory
-        return Path(os.path.dirname(sys.executable))
-    else:
-        # Running as script - use script directory
-        return Path(__file__).parent.parent
+    return BASE_PATH
+
+
+class _SubstringIndex:
+    """
+    Suffix trie over lowercased object names for case-insensitive substring search.
+
+    Every node keeps the objects whose names contain the node's path, in insertion
+    order, so a query is a walk of len(query) steps regardless of catalog size.
+    """
+
+    __slots__ = ("children", "objects")
+
+    def __init__(self):
+        self.children = {}
+        self.objects = []
+
+    def add(self, name, obj):
+        """Index obj under every substring of name."""
+        name_lower = name.lower()
+        self._append(obj)
+        for start in range(len(name_lower)):
+            node = self
+            for char in name_lower[start:]:
+                node = node.children.setdefault(char, _SubstringIndex())
+                node._append(obj)
+
+    def _append(self, obj):
+        # Suffixes of one name are inserted back to back, so a repeat is always last
+        if not self.objects or self.objects[-1] is not obj:
+            self.objects.append(obj)
+
+    def search(self, term):
+        """Return objects whose name contains term (case-insensitive)."""
+        node = self
+        for char in term.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return list(node.objects)
 
 
 class CelestialDatabase:
     """Manages celestial object definitions and catalog with dynamic loading."""
 
-    def __init__(self, catalog_file="data/celestial_objects.json"):
-        # Get correct base path for both dev and compiled modes
-        base_path = get_base_path()
-        self.catalog_file = base_path / catalog_file
-        self.catalog_data = None
+    DEFAULT_CATEGORIES = ("star", "planets", "dwarf_planets", "moons", "spacecraft")
+
+    def __init__(self, catalog_file="data/celestial_objects.json", use_cache=True):
+        self.catalog_file = BASE_PATH / catalog_file
+        # Pickled copy of the parsed catalog, reused while the JSON is unchanged
+        self.cache_file = self.catalog_file.with_suffix('.json.cache')
+        self.use_cache = use_cache
+        self._by_category = {}  # category name -> master definitions with quoted commands
+        self._catalog_info = None  # version/metadata captured while loading
         self.definitions = []
-        self.active_categories = ["star", "planets", "dwarf_planets", "moons", "spacecraft"]  # Default categories
+        # Lookup indexes over self.definitions, rebuilt by _index_definitions()
+        self._by_type = defaultdict(list)
+        self._name_index = _SubstringIndex()
+        self._stats_by_type = Counter()
+        # Active categories as a bitmask: catalog category i <-> bit (1 << i)
+        self._bit_to_cat = []
+        self._cat_bits = {}
+        self._active_mask = 0
         self._load_catalog()
 
     def _load_catalog(self):
         """Load celestial objects from JSON catalog file."""
         try:
             if self.catalog_file.exists():
-                with open(self.catalog_file, 'r', encoding='utf-8') as f:
-                    self.catalog_data = json.load(f)
-
-                logging.info(f"Loaded catalog version {self.catalog_data.get('version', 'unknown')}")
-                logging.info(f"Last updated: {self.catalog_data.get('last_updated', 'unknown')}")
+                catalog_data = self._read_catalog()
+
+                # Keep only the category lists and the few metadata fields we
+                # report; the rest of the parsed document is released here
+                metadata = catalog_data.get('metadata', {})
+                self._by_category = {
+                    category: tuple(self._quote_command(obj) for obj in objects)
+                    for category, objects in catalog_data.get('categories', {}).items()
+                }
+                self._bit_to_cat = list(self._by_category)
+                self._cat_bits = {name: 1 << i for i, name in enumerate(self._bit_to_cat)}
+                self._active_mask = self._mask_for(self.DEFAULT_CATEGORIES)
+                self._catalog_info = {
+                    'version': catalog_data.get('version'),
+                    'last_updated': catalog_data.get('last_updated'),
+                    'total_objects': metadata.get('total_objects', 0),
+                    'categories': metadata.get('categories_count', {}),
+                }
+
+                logging.info(f"Loaded catalog version {self._catalog_info['version'] or 'unknown'}")
+                logging.info(f"Last updated: {self._catalog_info['last_updated'] or 'unknown'}")
 
                 # Load objects from active categories
                 self._load_active_categories()
@@ -48,28 +119,110 @@ class CelestialDatabase:
                 logging.warning(f"Catalog file not found: {self.catalog_file}")
                 # Fall back to minimal set
                 self.definitions = self._get_fallback_definitions()
+                self._index_definitions()
         except Exception as e:
             logging.error(f"Error loading catalog: {e}")
             self.definitions = self._get_fallback_definitions()
+            self._index_definitions()
+
+    @staticmethod
+    def _quote_command(obj):
+        """
+        Return a copy of a catalog entry with its command quoted for the Horizons
+        API. The quoting is done once here; each category reload copies these
+        masters again, so callers never hold them.
+        """
+        obj_copy = dict(obj)
+        if not obj_copy['command'].startswith("'"):
+            obj_copy['command'] = f"'{obj_copy['command']}'"
+        return obj_copy
+
+    def _read_catalog(self):
+        """
+        Parse the catalog, using the pickle sidecar when it matches the JSON file.
+
+        The sidecar starts with a (mtime_ns, size) header for the JSON file it was
+        built from; if that no longer matches, the JSON is parsed and the sidecar
+        rewritten.
+
+        Returns:
+            Parsed catalog dictionary
+        """
+        stat = self.catalog_file.stat()
+        source_key = (stat.st_mtime_ns, stat.st_size)
+
+        if self.use_cache and self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'rb') as f:
+                    if pickle.load(f) == source_key:
+                        logging.info("Loaded catalog from cache")
+                        return pickle.load(f)
+            except Exception as e:
+                logging.warning(f"Ignoring unreadable catalog cache: {e}")
+
+        catalog_data = orjson.loads(self.catalog_file.read_bytes())
+
+        if self.use_cache:
+            # Write to a temp file and swap it in so readers never see a partial cache
+            try:
+                tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump(source_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(catalog_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, self.cache_file)
+            except Exception as e:
+                logging.warning(f"Could not write catalog cache: {e}")
+
+        return catalog_data
+
+    def _mask_for(self, categories):
+        """Bitmask for the given category names (unknown names are ignored)."""
+        mask = 0
+        for category in categories:
+            mask |= self._cat_bits.get(category, 0)
+        return mask
+
+    @property
+    def active_categories(self):
+        """Names of the active categories, in catalog order."""
+        if not self._bit_to_cat:
+            # No catalog loaded (fallback definitions): report the defaults
+            return list(self.DEFAULT_CATEGORIES)
+        names = []
+        mask = self._active_mask
+        while mask:
+            lowest = mask & -mask
+            names.append(self._bit_to_cat[lowest.bit_length() - 1])
+            mask ^= lowest
+        return names
 
     def _load_active_categories(self):
         """Load objects from currently active categories."""
-        self.definitions = []
-        categories = self.catalog_data.get('categories', {})
-
-        for category in self.active_categories:
-            if category in categories:
-                objects = categories[category]
-                # Add quotes around command codes for API compatibility
-                for obj in objects:
-                    obj_copy = obj.copy()
-                    # Ensure command has quotes
-                    if not obj_copy['command'].startswith("'"):
-                        obj_copy['command'] = f"'{obj_copy['command']}'"
-                    self.definitions.append(obj_copy)
+        # Commands were quoted once at catalog load; the entries are copied so
+        # that callers mutating a definition can't alter later reloads
+        self.definitions = [
+            dict(obj) for obj in itertools.chain.from_iterable(
+                self._by_category[category] for category in self.active_categories
+            )
+        ]
+        self._index_definitions()
 
         logging.info(f"Loaded {len(self.definitions)} objects from categories: {', '.join(self.active_categories)}")
 
+    def _index_definitions(self):
+        """Rebuild the type, name and statistics indexes from self.definitions."""
+        self._by_type = defaultdict(list)
+        self._name_index = _SubstringIndex()
+        self._stats_by_type = Counter()
+        for obj in self.definitions:
+            self._add_to_indexes(obj)
+
+    def _add_to_indexes(self, obj):
+        """Add a single definition to the lookup indexes."""
+        self._by_type[obj['type']].append(obj)
+        self._name_index.add(obj['name'], obj)
+        self._stats_by_type[obj['type']] += 1
+
     def _get_fallback_definitions(self):
         """Return minimal fallback definitions if JSON loading fails."""
         return [
@@ -97,7 +250,8 @@ class CelestialDatabase:
         Returns:
             List of objects matching the type
         """
-        return [obj for obj in self.definitions if obj["type"] == obj_type]
+        # A new list, so callers can't reorder or extend the index
+        return list(self._by_type.get(obj_type, ()))
 
     def get_objects_by_category(self, category):
         """
@@ -109,21 +263,8 @@ class CelestialDatabase:
         Returns:
             List of objects in that category
         """
-        if not self.catalog_data:
-            return []
-
-        categories = self.catalog_data.get('categories', {})
-        if category in categories:
-            objects = categories[category]
-            # Add quotes to command codes
-            result = []
-            for obj in objects:
-                obj_copy = obj.copy()
-                if not obj_copy['command'].startswith("'"):
-                    obj_copy['command'] = f"'{obj_copy['command']}'"
-                result.append(obj_copy)
-            return result
-        return []
+        # Fresh copies: the stored masters are reused by every category reload
+        return [dict(obj) for obj in self._by_category.get(category, ())]
 
     def search_by_name(self, search_term):
         """
@@ -135,8 +276,7 @@ class CelestialDatabase:
         Returns:
             List of matching objects
         """
-        search_lower = search_term.lower()
-        return [obj for obj in self.definitions if search_lower in obj["name"].lower()]
+        return self._name_index.search(search_term)
 
     def set_active_categories(self, categories):
         """
@@ -145,9 +285,12 @@ class CelestialDatabase:
         Args:
             categories: List of category names to activate
         """
-        self.active_categories = categories
+        for category in categories:
+            if category not in self._cat_bits:
+                logging.warning(f"Unknown category: {category}")
+        self._active_mask = self._mask_for(categories)
         self._load_active_categories()
-        logging.info(f"Active categories set to: {', '.join(categories)}")
+        logging.info(f"Active categories set to: {', '.join(self.active_categories)}")
 
     def add_category(self, category):
         """
@@ -156,8 +299,11 @@ class CelestialDatabase:
         Args:
             category: Category name to add
         """
-        if category not in self.active_categories:
-            self.active_categories.append(category)
+        bit = self._cat_bits.get(category)
+        if bit is None:
+            logging.warning(f"Unknown category: {category}")
+        elif not self._active_mask & bit:
+            self._active_mask |= bit
             self._load_active_categories()
             logging.info(f"Added category: {category}")
 
@@ -168,27 +314,23 @@ class CelestialDatabase:
         Args:
             category: Category name to remove
         """
-        if category in self.active_categories:
-            self.active_categories.remove(category)
+        bit = self._cat_bits.get(category, 0)
+        if self._active_mask & bit:
+            self._active_mask &= ~bit
             self._load_active_categories()
             logging.info(f"Removed category: {category}")
 
     def get_available_categories(self):
         """Get list of all available categories in the catalog."""
-        if not self.catalog_data:
-            return []
-        return list(self.catalog_data.get('categories', {}).keys())
+        return list(self._by_category)
 
     def get_catalog_info(self):
         """Get metadata about the loaded catalog."""
-        if not self.catalog_data:
+        if self._catalog_info is None:
             return None
 
         return {
-            'version': self.catalog_data.get('version'),
-            'last_updated': self.catalog_data.get('last_updated'),
-            'total_objects': self.catalog_data.get('metadata', {}).get('total_objects', 0),
-            'categories': self.catalog_data.get('metadata', {}).get('categories_count', {}),
+            **self._catalog_info,
             'active_categories': self.active_categories,
             'loaded_objects': len(self.definitions)
         }
@@ -208,24 +350,20 @@ class CelestialDatabase:
         if not command.startswith("'"):
             command = f"'{command}'"
 
-        self.definitions.append({
+        obj = {
             "name": name,
             "command": command,
             "type": type_,
             "size": size,
             "description": description
-        })
+        }
+        self.definitions.append(obj)
+        self._add_to_indexes(obj)
         logging.info(f"Added custom object: {name}")
 
     def get_statistics(self):
         """Get statistics about loaded objects."""
-        stats = {
+        return {
             'total': len(self.definitions),
-            'by_type': {}
+            'by_type': dict(self._stats_by_type)
         }
-
-        for obj in self.definitions:
-            obj_type = obj['type']
-            stats['by_type'][obj_type] = stats['by_type'].get(obj_type, 0) + 1
-
-        return stats
@@ -2,20 +2,111 @@
 Celestial object model.
 Represents a celestial body with position, type, and visual properties.
 """
-import pygame
+import functools
+import math
 import numpy as np
-from scipy.io import wavfile
-from io import BytesIO
 import queue
 
 
 # Screen settings (imported from main - will be passed in later refactor)
 WIDTH, HEIGHT = 1200, 800
+SCREEN_SCALE = 500  # Pixels per AU; adjust as needed for visibility
+FPS = 30  # Frame rate assumed by position updates
+_SCREEN_CENTER_X = WIDTH // 2
+_SCREEN_CENTER_Y = HEIGHT // 2
+
+# Fallback tone synthesis; rate-dependent tables are built per mixer rate
+_TONE_SECONDS = 0.2  # 0.2 second tones
+_FADE_SECONDS = 0.02  # 20ms fade
+_LUT_SIZE = 4096  # Single sine cycle, power of two so phase wraps with a mask
+_PHASE_FRAC_BITS = 16  # Fixed-point fraction of the phase accumulator
+_SINE_LUT = (np.sin(np.linspace(0, 2 * np.pi, _LUT_SIZE, endpoint=False, dtype=np.float32)) * 32767).astype(np.int16)
+
+# Base tone frequency per object type
+_TYPE_BASE_FREQ = {
+    "Star": 220.0,        # A3 (low, powerful)
+    "Planet": 440,        # A4
+    "Moon": 523.25,       # C5
+    "Asteroid": 587.33,   # D5
+    "Comet": 659.25,      # E5
+    "Spacecraft": 784.00, # G5
+    "Dwarf Planet": 493.88  # B4
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _tone_tables(sample_rate):
+    """Sample indices and fade ramps for one tone at the given mixer rate."""
+    sample_index = np.arange(int(sample_rate * _TONE_SECONDS), dtype=np.uint64)
+    fade_in = np.linspace(0, 1, int(sample_rate * _FADE_SECONDS), dtype=np.float32)
+    return sample_index, fade_in, fade_in[::-1].copy()
+
+
+def _sound_for(type_, distance_bucket):
+    """
+    Return the fallback tone for an object type and distance bucket.
+
+    Objects that share a type and bucket share the returned Sound, so its volume
+    is applied at play time rather than baked in here.
+
+    Args:
+        type_: Object type string
+        distance_bucket: int(log1p(distance) * 10)
+
+    Returns:
+        pygame.mixer.Sound
+    """
+    # Imported here so modules that only need positions (API client, cache
+    # loading) don't pull pygame in
+    import pygame.mixer
+
+    # make_sound() takes raw samples at the mixer's own rate and channel count,
+    # which pygame 2 may pick from the device, so both are part of the cache key
+    sample_rate, _, channels = pygame.mixer.get_init()
+    return _synthesize_tone(type_, distance_bucket, sample_rate, channels)
+
+
+@functools.lru_cache(maxsize=256)
+def _synthesize_tone(type_, distance_bucket, sample_rate, channels):
+    """Synthesize (and cache) a fallback tone for the given mixer settings."""
+    import pygame.sndarray
+
+    base_freq = _TYPE_BASE_FREQ.get(type_, 440)  # Default to 440 Hz if type unknown
+
+    # Use logarithmic scaling for distance to keep frequencies safe
+    freq = base_freq + distance_bucket / 10 * 50
+
+    # Clamp to safe hearing range (100 Hz - 2000 Hz)
+    freq = min(2000.0, max(100.0, freq))
+
+    # Step through the sine table with a fixed-point phase accumulator
+    # (table lookups instead of per-sample sin, already at 16-bit amplitude)
+    sample_index, fade_in, fade_out = _tone_tables(sample_rate)
+    phase_step = np.uint64(round(freq * _LUT_SIZE * (1 << _PHASE_FRAC_BITS) / sample_rate))
+    phase = ((sample_index * phase_step) >> np.uint64(_PHASE_FRAC_BITS)) & np.uint64(_LUT_SIZE - 1)
+    audio = _SINE_LUT[phase]
+
+    # Apply fade-in and fade-out to prevent clicks
+    fade_samples = len(fade_in)
+    audio[:fade_samples] = audio[:fade_samples] * fade_in
+    audio[-fade_samples:] = audio[-fade_samples:] * fade_out
+
+    # Hand the samples straight to the mixer (no WAV encode/decode); the buffer
+    # must match the mixer's channel count, which is stereo by default
+    if channels > 1:
+        audio = np.repeat(audio[:, np.newaxis], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(audio))
 
 
 class CelestialObject:
     """Represents a celestial body in space."""
 
+    # Fixed attribute layout (no per-instance __dict__)
+    __slots__ = (
+        "name", "type", "x", "y", "z", "vx", "vy", "vz", "parent", "size",
+        "distance", "screen_pos", "sound", "_tone_volume",
+    )
+
     def __init__(self, name, type_, x, y, z, size, distance, vx=0.0, vy=0.0, vz=0.0, parent=None, generate_sound=True):
         self.name = name
         self.type = type_  # 'Planet', 'Asteroid', 'Comet', 'Spacecraft'
@@ -30,14 +121,14 @@ class CelestialObject:
         self.distance = distance  # From observer in AU
         self.screen_pos = self.calculate_screen_position()
         # Sound will be set by AudioEngine or generated locally
+        self._tone_volume = None  # Play-time volume of a generated (shared) tone
         self.sound = self.generate_sound() if generate_sound else None
 
     def calculate_screen_position(self):
         """Calculate 2D screen position from 3D coordinates."""
         # Simple scaling for visualization
-        scale = 500  # Adjust as needed for visibility
-        screen_x = WIDTH // 2 + int(self.x * scale)
-        screen_y = HEIGHT // 2 - int(self.y * scale)
+        screen_x = _SCREEN_CENTER_X + int(self.x * SCREEN_SCALE)
+        screen_y = _SCREEN_CENTER_Y - int(self.y * SCREEN_SCALE)
         return (screen_x, screen_y)
 
     def update_position(self, time_scale=1.0):
@@ -52,14 +143,15 @@ class CelestialObject:
         # Update position: new_pos = old_pos + velocity * time_delta
         # time_delta is in days (time_scale / FPS)
         # At 30 FPS with time_scale=1.0: each frame = 1/30 day = ~48 minutes
-        time_delta = time_scale / 30.0  # Assuming 30 FPS
+        time_delta = time_scale / FPS
 
-        self.x += self.vx * time_delta
-        self.y += self.vy * time_delta
-        self.z += self.vz * time_delta
+        x = self.x + self.vx * time_delta
+        y = self.y + self.vy * time_delta
+        z = self.z + self.vz * time_delta
+        self.x, self.y, self.z = x, y, z
 
         # Recalculate derived values
-        self.distance = (self.x**2 + self.y**2 + self.z**2) ** 0.5
+        self.distance = math.sqrt(x * x + y * y + z * z)
         self.screen_pos = self.calculate_screen_position()
 
     def generate_sound(self):
@@ -68,53 +160,14 @@ class CelestialObject:
         Uses safe frequencies and shorter duration.
 
         NOTE: This is a fallback method. AudioEngine is preferred.
+        The returned Sound is shared with objects in the same distance bucket;
+        this object's volume is applied by play_sound().
         """
-        duration = 0.2  # Shortened to 0.2 seconds for less intrusive audio
-
         # Safe volume calculation (max 60%, min 5%)
         volume = 1.0 / max(0.5, self.distance ** 2)
-        volume = min(0.6, max(0.05, volume))
-
-        # Base frequency for types
-        base_freq = {
-            "Star": 220.0,        # A3 (low, powerful)
-            "Planet": 440,        # A4
-            "Moon": 523.25,       # C5
-            "Asteroid": 587.33,   # D5
-            "Comet": 659.25,      # E5
-            "Spacecraft": 784.00, # G5
-            "Dwarf Planet": 493.88  # B4
-        }.get(self.type, 440)  # Default to 440 Hz if type unknown
-
-        # Use logarithmic scaling for distance to keep frequencies safe
-        distance_factor = np.log1p(self.distance) * 50
-        freq = base_freq + distance_factor
-
-        # Clamp to safe hearing range (100 Hz - 2000 Hz)
-        freq = np.clip(freq, 100.0, 2000.0)
-
-        sample_rate = 44100  # Samples per second
-        t = np.linspace(0, duration, int(sample_rate * duration), False)
-        note = np.sin(freq * t * 2 * np.pi)
-
-        # Apply fade-in and fade-out to prevent clicks
-        fade_samples = int(sample_rate * 0.02)  # 20ms fade
-        fade_in = np.linspace(0, 1, fade_samples)
-        fade_out = np.linspace(1, 0, fade_samples)
-        note[:fade_samples] *= fade_in
-        note[-fade_samples:] *= fade_out
-
-        # Normalize to 16-bit range
-        audio = note * (2**15 - 1) / np.max(np.abs(note))
-        audio = audio.astype(np.int16)
-
-        # Convert to bytes
-        sound_buffer = BytesIO()
-        wavfile.write(sound_buffer, sample_rate, audio)
-        sound_buffer.seek(0)
-        sound = pygame.mixer.Sound(sound_buffer)
-        sound.set_volume(volume)
-        return sound
+        self._tone_volume = min(0.6, max(0.05, volume))
+
+        return _sound_for(self.type, int(math.log1p(self.distance) * 10))
 
     def set_sound(self, sound):
         """
@@ -124,10 +177,18 @@ class CelestialObject:
             sound: pygame.mixer.Sound object
         """
         self.sound = sound
+        self._tone_volume = None  # AudioEngine sounds carry their own volume
+
+    def play_sound(self, master_volume=1.0):
+        """
+        Play the object's audio tone.
 
-    def play_sound(self):
-        """Play the object's audio tone."""
+        Args:
+            master_volume: Master volume multiplier, applied to generated tones
+        """
         if self.sound:
+            if self._tone_volume is not None:
+                self.sound.set_volume(self._tone_volume * master_volume)
             self.sound.play()
 
     def announce(self, speech_queue: queue.Queue, config_manager=None):
@@ -157,3 +218,54 @@ class CelestialObject:
             "size": self.size,
             "distance": self.distance
         }
+
+
+class CelestialObjectPool:
+    """
+    Structure-of-arrays kinematics for a list of CelestialObjects.
+
+    The pool copies every object's position and velocity into arrays when it
+    is built, so a frame update is a handful of vectorized operations instead
+    of one Python update_position() call per object. step() then writes the
+    results back to the objects' ordinary attributes as plain floats, so other
+    code reads them at normal attribute speed. Coordinates stay float64:
+    positions are integrated every frame and float32 would drift.
+    """
+
+    def __init__(self, objects):
+        self.objects = list(objects)
+        count = len(self.objects)
+
+        self.x = np.fromiter((obj.x for obj in self.objects), dtype=np.float64, count=count)
+        self.y = np.fromiter((obj.y for obj in self.objects), dtype=np.float64, count=count)
+        self.z = np.fromiter((obj.z for obj in self.objects), dtype=np.float64, count=count)
+        self.vx = np.fromiter((obj.vx for obj in self.objects), dtype=np.float64, count=count)
+        self.vy = np.fromiter((obj.vy for obj in self.objects), dtype=np.float64, count=count)
+        self.vz = np.fromiter((obj.vz for obj in self.objects), dtype=np.float64, count=count)
+
+    def step(self, time_scale=1.0):
+        """
+        Advance every object by one frame (vectorized update_position).
+
+        Args:
+            time_scale: Days of simulated time per second of real time
+        """
+        time_delta = time_scale / FPS
+
+        self.x += self.vx * time_delta
+        self.y += self.vy * time_delta
+        self.z += self.vz * time_delta
+
+        distance = np.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+        # astype(int) truncates toward zero, matching calculate_screen_position()
+        screen_x = _SCREEN_CENTER_X + (self.x * SCREEN_SCALE).astype(np.int64)
+        screen_y = _SCREEN_CENTER_Y - (self.y * SCREEN_SCALE).astype(np.int64)
+
+        # One pass writing plain Python numbers back to the objects
+        for obj, x, y, z, dist, sx, sy in zip(
+            self.objects, self.x.tolist(), self.y.tolist(), self.z.tolist(),
+            distance.tolist(), screen_x.tolist(), screen_y.tolist()
+        ):
+            obj.x, obj.y, obj.z, obj.distance = x, y, z, dist
+            obj.screen_pos = (sx, sy)
@@ -18,7 +18,15 @@ except ImportError:
 
 
 class SpeechHandler(threading.Thread):
-    """Thread to handle speech asynchronously."""
+    """
+    Thread to handle speech asynchronously.
+
+    Queue items are either plain strings or (category, text) tuples. When
+    several items are waiting, a tagged item is dropped if a newer one with the
+    same category is queued behind it (e.g. help titles while arrowing quickly),
+    and a tagged text identical to the tagged text just before it is spoken
+    once. Plain strings are never dropped, so deliberate repeats are heard.
+    """
     def __init__(self, speech_queue: queue.Queue, stop_event: threading.Event):
         super().__init__(daemon=True)
         self.speech_queue = speech_queue
@@ -26,16 +34,55 @@ class SpeechHandler(threading.Thread):
 
     def run(self):
         """Main thread loop to handle speech messages."""
-        while not self.stop_event.is_set():
-            try:
-                # Wait for a speech message with a timeout
-                message = self.speech_queue.get(timeout=0.1)
-                if message:
-                    self._speak_message(message)
-            except queue.Empty:
-                continue  # No message in queue, continue waiting
-            except Exception as e:
-                logging.error(f"Error in SpeechHandler: {e}")
+        while True:
+            # Block until there is something to say; shutdown() wakes us with None
+            message = self.speech_queue.get()
+            if message is None or self.stop_event.is_set():
+                break
+
+            # Take everything else already waiting so stale items can be skipped
+            pending = [message]
+            stopping = False
+            while True:
+                try:
+                    message = self.speech_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    stopping = True
+                    break
+                pending.append(message)
+            if stopping:
+                break
+
+            for text in self._coalesce(pending):
+                try:
+                    self._speak_message(text)
+                except Exception as e:
+                    logging.error(f"Error in SpeechHandler: {e}")
+
+    @staticmethod
+    def _coalesce(messages):
+        """Reduce queued messages to the texts still worth speaking, in order."""
+        latest = {}  # category -> index of its newest message
+        for index, message in enumerate(messages):
+            if isinstance(message, tuple):
+                latest[message[0]] = index
+
+        texts = []
+        last_tagged = None  # Text of the previous kept item, if it was tagged
+        for index, message in enumerate(messages):
+            if isinstance(message, tuple):
+                if latest[message[0]] != index:
+                    continue  # Superseded by a newer message of the same category
+                text = message[1]
+                if text and text != last_tagged:
+                    texts.append(text)
+                last_tagged = text
+            elif message:
+                texts.append(message)
+                last_tagged = None
+        return texts
 
     def _speak_message(self, message: str):
         """Speak the given message using Tolk."""
@@ -53,4 +100,5 @@ class SpeechHandler(threading.Thread):
     def shutdown(self):
         """Stop the speech handler gracefully."""
         self.stop_event.set()  # Signal the thread to stop
+        self.speech_queue.put(None)  # Wake the blocking get() so the loop sees it
         self.join(timeout=1)  # Wait for the thread to finish
@@ -2,33 +2,80 @@
 NASA Horizons API client.
 Fetches celestial object data from JPL Horizons system.
 """
+import orjson
 import requests
 import logging
-import re
-import json
+import math
+import itertools
 import os
+import pickle
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from models.celestial_object import CelestialObject
 
+# Objects are fetched concurrently over one keep-alive session. Horizons takes a
+# single COMMAND per request, so batching isn't possible; instead every worker
+# keeps its own connection to the one host alive. The session is shared by all
+# clients because the app creates a new client for every fetch.
+_MAX_WORKERS = 8
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=_MAX_WORKERS))
+
+# Bumped whenever the layout of the pickled position cache changes
+_CACHE_FORMAT = 2
+
+# Cached position lifetime by object type: planets drift slowly over days,
+# small bodies and spacecraft move noticeably within hours
+_CACHE_TTL_HOURS = {
+    "Star": 168,
+    "Planet": 168,
+    "Moon": 72,
+    "Dwarf Planet": 48,
+    "Asteroid": 12,
+    "Comet": 12,
+    "Spacecraft": 12,
+}
+
+
+# Resolved once at import; Nuitka exposes __compiled__ as a module global
+if getattr(sys, 'frozen', False) or '__compiled__' in dir():
+    BASE_PATH = Path(os.path.dirname(sys.executable))
+else:
+    BASE_PATH = Path(__file__).parent.parent
+
 
 def get_base_path():
     """Get the base path for data files, handling both dev and compiled scenarios."""
-    if getattr(sys, 'frozen', False) or '__compiled__' in dir():
-        return Path(os.path.dirname(sys.executable))
-    else:
-        return Path(__file__).parent.parent
+    return BASE_PATH
 
 
 class HorizonsAPIClient:
     """Client for NASA JPL Horizons API."""
 
-    def __init__(self, cache_file="data/celestial_cache.json"):
+    # Query parameters common to every request; the time span and COMMAND are
+    # filled in per batch and per object
+    _BASE_PARAMS = {
+        "format": "json",
+        "EPHEM_TYPE": "VECTORS",
+        "CENTER": "'@sun'",          # Heliocentric
+        "STEP_SIZE": "'1'",            # One interval: start and stop records
+        "REF_PLANE": "'ECLIPTIC'",
+        "OUT_UNITS": "'AU-D'",
+        "VEC_CORR": "'NONE'",
+        "VEC_LABELS": "'NO'",          # Bare numbers, parsed with split()
+    }
+
+    def __init__(self, cache_file="data/celestial_cache.pkl"):
         self.base_url = "https://ssd.jpl.nasa.gov/api/horizons.api"
-        base_path = get_base_path()
-        self.cache_file = base_path / cache_file
-        self.cache_max_age_hours = 24  # Cache valid for 24 hours
+        self.cache_file = BASE_PATH / cache_file
+        self.cache_max_age_hours = 24  # Default cache TTL for types not in _CACHE_TTL_HOURS
+        # Objects are fetched concurrently over the shared keep-alive session
+        self.max_workers = _MAX_WORKERS
+        self.session = _session
 
     def _save_to_cache(self, objects_data):
         """
@@ -41,278 +88,283 @@ class HorizonsAPIClient:
             # Ensure data directory exists
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'objects': objects_data
-            }
+            cache_data = {'format': _CACHE_FORMAT, 'objects': objects_data}
 
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            # Write to a temp file and swap it in so readers never see a partial cache
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
 
             logging.info(f"Cached {len(objects_data)} objects to {self.cache_file}")
         except Exception as e:
             logging.error(f"Failed to save cache: {e}")
 
-    def _load_from_cache(self):
+    def _ttl_hours(self, obj_type):
+        """Hours a cached position of this object type stays valid."""
+        return _CACHE_TTL_HOURS.get(obj_type, self.cache_max_age_hours)
+
+    def _cache_expired(self):
         """
-        Load celestial object data from cache file.
+        Whether the cache file is too old to hold any fresh entry.
+
+        The file is rewritten on every fetch, so its mtime is the age of the
+        newest entry: once that exceeds the longest TTL, every entry is stale and
+        the file needn't be unpickled just to find that out.
+        """
+        try:
+            mtime = self.cache_file.stat().st_mtime
+        except OSError:
+            return False
+
+        age_hours = (time.time() - mtime) / 3600
+        if age_hours > max(self.cache_max_age_hours, *_CACHE_TTL_HOURS.values()):
+            logging.info(f"Cache expired ({age_hours:.1f} hours old)")
+            return True
+        return False
+
+    def _load_cache_entries(self):
+        """
+        Read every entry from the cache file, fresh or not.
+
+        Each entry carries its own fetch timestamp and ttl_hours; _is_fresh()
+        decides whether it needs refetching. Stale entries are still returned so
+        they can stand in for objects the API fails to deliver.
 
         Returns:
-            List of CelestialObject instances, or None if cache unavailable/expired
+            List of cached object dicts, or None if the cache is unavailable
         """
         try:
             if not self.cache_file.exists():
                 logging.info("No cache file found")
                 return None
 
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-
-            # Check cache age
-            timestamp = datetime.fromisoformat(cache_data['timestamp'])
-            age_hours = (datetime.now() - timestamp).total_seconds() / 3600
+            with open(self.cache_file, 'rb') as f:
+                cache_data = pickle.load(f)
 
-            if age_hours > self.cache_max_age_hours:
-                logging.info(f"Cache expired ({age_hours:.1f} hours old)")
+            if cache_data.get('format') != _CACHE_FORMAT:
+                logging.info("Ignoring cache written in an older format")
                 return None
 
-            # Convert cached data back to CelestialObject instances
-            objects = []
-            for obj_data in cache_data['objects']:
-                try:
-                    obj = CelestialObject(
-                        name=obj_data['name'],
-                        type_=obj_data['type'],
-                        x=obj_data['x'],
-                        y=obj_data['y'],
-                        z=obj_data['z'],
-                        size=obj_data.get('size', 5),
-                        distance=obj_data['distance'],
-                        vx=obj_data.get('vx', 0.0),
-                        vy=obj_data.get('vy', 0.0),
-                        vz=obj_data.get('vz', 0.0),
-                        parent=obj_data.get('parent'),
-                        generate_sound=False
-                    )
-                    objects.append(obj)
-                except Exception as e:
-                    logging.error(f"Error loading cached object {obj_data.get('name', 'unknown')}: {e}")
-
-            logging.info(f"Loaded {len(objects)} objects from cache ({age_hours:.1f} hours old)")
-            return objects
+            return cache_data['objects']
 
         except Exception as e:
             logging.error(f"Failed to load cache: {e}")
             return None
 
-    def fetch_celestial_objects(self, object_definitions):
+    @staticmethod
+    def _is_fresh(entry, now):
+        """Whether a cache entry is still within its TTL."""
+        age_hours = (now - datetime.fromisoformat(entry['timestamp'])).total_seconds() / 3600
+        return age_hours <= entry['ttl_hours']
+
+    def _objects_from_cache_entries(self, entries):
+        """Convert cached object dicts back to CelestialObject instances."""
+        objects = []
+        for entry in entries:
+            try:
+                objects.append(CelestialObject(**entry['state'], generate_sound=False))
+            except Exception as e:
+                logging.error(f"Error loading cached object {entry['state'].get('name', 'unknown')}: {e}")
+        return objects
+
+    def _load_from_cache(self):
+        """
+        Load celestial object data from cache file.
+
+        Returns:
+            List of CelestialObject instances (including stale ones), or None if
+            the cache is unavailable or entirely expired
+        """
+        if self._cache_expired():
+            return None
+
+        entries = self._load_cache_entries()
+        if not entries:
+            return None
+
+        objects = self._objects_from_cache_entries(entries)
+        logging.info(f"Loaded {len(objects)} objects from cache")
+        return objects
+
+    def _query_params(self):
+        """Shared query parameters for one batch: a single step starting today (UTC)."""
+        # Only the first record is used, so one interval is all that's needed
+        start_date = datetime.now(timezone.utc).date()
+        return {
+            **self._BASE_PARAMS,
+            "START_TIME": f"'{start_date}'",
+            "STOP_TIME": f"'{start_date + timedelta(days=1)}'",
+        }
+
+    def _fetch_one(self, obj, base_params):
+        """
+        Fetch and parse the first ephemeris point for one object.
+
+        Args:
+            obj: Dict with name, command, type, size
+            base_params: Query parameters shared by every object (see _query_params)
+
+        Returns:
+            CelestialObject instance, or None if the object couldn't be loaded
+        """
+        # Validate COMMAND format (remove extra quotes if present)
+        command = obj["command"].strip("'\"")
+        params = {**base_params, "COMMAND": f"'{command}'"}
+
+        try:
+            response = self.session.get(self.base_url, params=params, timeout=10)
+            response.raise_for_status()
+            # Parse the raw bytes directly; response.json() first decodes them to str
+            data = orjson.loads(response.content)
+
+            # Check if 'result' key exists in the response
+            if "result" not in data:
+                logging.error(f"No 'result' data found for {obj['name']}. Response: {data}")
+                return None
+
+            # Parse text-based ephemeris data from result field
+            result_text = data['result']
+
+            # Extract data between $$SOE and $$EOE markers
+            if '$$SOE' not in result_text or '$$EOE' not in result_text:
+                logging.error(f"No ephemeris data markers found for {obj['name']}")
+                return None
+
+            # The first record (the only one used) is a JD/date line followed by
+            # the position and velocity lines, each three unlabeled numbers
+            soe_start = result_text.index('$$SOE') + 5
+            eoe_end = result_text.index('$$EOE')
+            record = result_text[soe_start:eoe_end].strip().split('\n', 3)
+            if len(record) < 3:
+                logging.warning(f"Incomplete ephemeris record for {obj['name']}")
+                return None
+
+            x, y, z = map(float, record[1].split())
+            vx, vy, vz = map(float, record[2].split())
+            distance = math.hypot(x, y, z)
+
+            celestial_object = CelestialObject(
+                name=obj["name"],
+                type_=obj["type"],
+                x=x,
+                y=y,
+                z=z,
+                size=obj.get("size", 5),
+                distance=distance,
+                vx=vx,
+                vy=vy,
+                vz=vz,
+                parent=obj.get("parent"),  # Parent object name
+                generate_sound=False  # Sound generated by AudioEngine later
+            )
+            logging.info(f"Loaded {obj['name']}: pos=({x:.3f}, {y:.3f}, {z:.3f}) AU, vel=({vx:.6f}, {vy:.6f}, {vz:.6f}) AU/day, distance={distance:.3f} AU")
+            return celestial_object
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Request exception for {obj['name']}: {e}")
+        except ValueError as ve:
+            logging.error(f"Value error processing data for {obj['name']}: {ve}")
+        except Exception as ex:
+            logging.error(f"Unexpected error fetching data for {obj['name']}: {ex}")
+
+        return None
+
+    def fetch_celestial_objects(self, object_definitions, cached_entries=None):
         """
         Fetch data for all celestial objects from the Horizons API.
 
+        Objects with a cached position still within their type's TTL are taken
+        from the cache instead of being requested again. If a refetch fails, the
+        stale cached position is served and kept in the cache.
+
         Args:
             object_definitions: List of dicts with name, command, type, size
+            cached_entries: Entries from _load_cache_entries(), if already read
 
         Returns:
             List of CelestialObject instances
         """
-        celestial_objects = []
-
-        for obj in object_definitions:
-            # Validate COMMAND format (remove extra quotes if present)
-            command = obj["command"].strip("'\"")
-            params = {
-                "format": "json",
-                "COMMAND": f"'{command}'",
-                "EPHEM_TYPE": "VECTORS",
-                "CENTER": "'@sun'",          # Heliocentric
-                "START_TIME": "'2024-12-01'",
-                "STOP_TIME": "'2024-12-31'",
-                "STEP_SIZE": "'1d'",
-                "REF_PLANE": "'ECLIPTIC'",
-                "OUT_UNITS": "'AU-D'",
-                "VEC_CORR": "'NONE'",
-                "VEC_LABELS": "'YES'",
-            }
+        return self._fetch_objects(object_definitions, cached_entries)[0]
 
-            try:
-                response = requests.get(self.base_url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                # Check if 'result' key exists in the response
-                if "result" not in data:
-                    logging.error(f"No 'result' data found for {obj['name']}. Response: {data}")
-                    continue
-
-                # Parse text-based ephemeris data from result field
-                result_text = data['result']
-
-                # Extract data between $$SOE and $$EOE markers
-                if '$$SOE' not in result_text or '$$EOE' not in result_text:
-                    logging.error(f"No ephemeris data markers found for {obj['name']}")
-                    continue
-
-                soe_start = result_text.index('$$SOE') + 5
-                eoe_end = result_text.index('$$EOE')
-                ephemeris_text = result_text[soe_start:eoe_end].strip()
-
-                # Parse the ephemeris lines using more robust regex patterns
-                # This handles variations in formatting and is more resilient to API changes
-                lines = ephemeris_text.split('\n')
-                x, y, z = None, None, None
-                vx, vy, vz = None, None, None
-
-                # Improved regex patterns that handle more format variations
-                # Matches scientific notation with optional signs and flexible spacing
-                coord_pattern = r'[-+]?\d+\.?\d*(?:[Ee][-+]?\d+)?'
-
-                for i, line in enumerate(lines):
-                    line = line.strip()
-
-                    # Try to parse position coordinates (X, Y, Z)
-                    # More flexible pattern that handles various spacing and formats
-                    # Check for lines starting with 'X' (not 'VX') to distinguish position from velocity
-                    if (line.startswith('X ') or line.startswith('X=')) and 'Y' in line and 'Z' in line:
-                        try:
-                            # Extract X, Y, Z values with improved regex
-                            x_match = re.search(rf'X\s*=\s*({coord_pattern})', line)
-                            y_match = re.search(rf'Y\s*=\s*({coord_pattern})', line)
-                            z_match = re.search(rf'Z\s*=\s*({coord_pattern})', line)
-
-                            if x_match and y_match and z_match:
-                                x = float(x_match.group(1))
-                                y = float(y_match.group(1))
-                                z = float(z_match.group(1))
-                                logging.debug(f"Parsed position for {obj['name']}: X={x}, Y={y}, Z={z}")
-                            else:
-                                # Try alternative parsing: split by spaces and look for numeric values
-                                parts = line.split()
-                                values = []
-                                for part in parts:
-                                    try:
-                                        val = float(part)
-                                        values.append(val)
-                                    except ValueError:
-                                        continue
-
-                                if len(values) >= 3:
-                                    x, y, z = values[0], values[1], values[2]
-                                else:
-                                    logging.warning(f"Could not parse coordinates from line: {line}")
-                                    continue
-                        except (ValueError, IndexError) as e:
-                            logging.error(f"Error parsing coordinates for {obj['name']}: {e}")
-                            continue
-
-                    # Try to parse velocity components (VX, VY, VZ)
-                    elif 'VX' in line and 'VY' in line and 'VZ' in line:
-                        try:
-                            # Extract VX, VY, VZ values with improved regex
-                            vx_match = re.search(rf'VX\s*=?\s*({coord_pattern})', line)
-                            vy_match = re.search(rf'VY\s*=?\s*({coord_pattern})', line)
-                            vz_match = re.search(rf'VZ\s*=?\s*({coord_pattern})', line)
-
-                            if vx_match and vy_match and vz_match:
-                                vx = float(vx_match.group(1))
-                                vy = float(vy_match.group(1))
-                                vz = float(vz_match.group(1))
-
-                                # Now we have both position and velocity, create object
-                                if x is not None and y is not None and z is not None:
-                                    distance = (x**2 + y**2 + z**2) ** 0.5
-
-                                    celestial_objects.append(
-                                        CelestialObject(
-                                            name=obj["name"],
-                                            type_=obj["type"],
-                                            x=x,
-                                            y=y,
-                                            z=z,
-                                            size=obj.get("size", 5),
-                                            distance=distance,
-                                            vx=vx,
-                                            vy=vy,
-                                            vz=vz,
-                                            parent=obj.get("parent"),  # Parent object name
-                                            generate_sound=False  # Sound generated by AudioEngine later
-                                        )
-                                    )
-                                    logging.info(f"Loaded {obj['name']}: pos=({x:.3f}, {y:.3f}, {z:.3f}) AU, vel=({vx:.6f}, {vy:.6f}, {vz:.6f}) AU/day, distance={distance:.3f} AU")
-                                    break  # Only take first ephemeris point
-                            else:
-                                # Try alternative parsing
-                                parts = line.split()
-                                values = []
-                                for part in parts:
-                                    try:
-                                        val = float(part)
-                                        values.append(val)
-                                    except ValueError:
-                                        continue
-
-                                if len(values) >= 3 and x is not None:
-                                    vx, vy, vz = values[0], values[1], values[2]
-                                    distance = (x**2 + y**2 + z**2) ** 0.5
-
-                                    celestial_objects.append(
-                                        CelestialObject(
-                                            name=obj["name"],
-                                            type_=obj["type"],
-                                            x=x,
-                                            y=y,
-                                            z=z,
-                                            size=obj.get("size", 5),
-                                            distance=distance,
-                                            vx=vx,
-                                            vy=vy,
-                                            vz=vz,
-                                            parent=obj.get("parent"),  # Parent object name
-                                            generate_sound=False  # Sound generated by AudioEngine later
-                                        )
-                                    )
-                                    logging.info(f"Loaded {obj['name']}: pos=({x:.3f}, {y:.3f}, {z:.3f}) AU, vel=({vx:.6f}, {vy:.6f}, {vz:.6f}) AU/day, distance={distance:.3f} AU")
-                                    break
-                                else:
-                                    logging.warning(f"Could not parse velocities from line: {line}")
-                        except (ValueError, IndexError) as e:
-                            logging.error(f"Error parsing velocities for {obj['name']}: {e}")
-                            continue
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request exception for {obj['name']}: {e}")
-            except ValueError as ve:
-                logging.error(f"Value error processing data for {obj['name']}: {ve}")
-            except Exception as ex:
-                logging.error(f"Unexpected error fetching data for {obj['name']}: {ex}")
-
-        # If we got objects, cache them
-        if celestial_objects:
-            # Convert to cacheable format
-            cache_data = []
-            for obj in celestial_objects:
-                cache_data.append({
-                    'name': obj.name,
-                    'type': obj.type,
-                    'x': obj.x,
-                    'y': obj.y,
-                    'z': obj.z,
-                    'size': obj.size,
-                    'distance': obj.distance,
-                    'vx': obj.vx,
-                    'vy': obj.vy,
-                    'vz': obj.vz,
-                    'parent': obj.parent
-                })
-            self._save_to_cache(cache_data)
-        else:
-            # No objects from API, try cache
-            logging.warning("No objects fetched from API, trying cache...")
-            cached_objects = self._load_from_cache()
-            if cached_objects:
-                return cached_objects
-            else:
-                logging.error("No cached data available. Cannot load celestial objects.")
-
-        return celestial_objects
+    def _fetch_objects(self, object_definitions, cached_entries=None):
+        """
+        Implementation of fetch_celestial_objects().
+
+        Returns:
+            Tuple of (List of CelestialObject instances, number of stale cached
+            objects served because the API didn't return them, number of objects
+            fetched from the API)
+        """
+        # An expired cache file isn't read up front: everything is refetched
+        cache_expired = cached_entries is None and self._cache_expired()
+        if cached_entries is None:
+            cached_entries = [] if cache_expired else (self._load_cache_entries() or [])
+        cached_entries = {entry['state']['name']: entry for entry in cached_entries}
+
+        # Objects whose cached position is still within its TTL aren't refetched
+        now = datetime.now()
+        to_fetch = [
+            obj for obj in object_definitions
+            if obj['name'] not in cached_entries or not self._is_fresh(cached_entries[obj['name']], now)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._fetch_one, to_fetch, itertools.repeat(self._query_params()))
+            fetched_objects = [obj for obj in results if obj is not None]
+
+        if to_fetch:
+            logging.info(f"Fetched {len(fetched_objects)} of {len(to_fetch)} objects, "
+                         f"{len(object_definitions) - len(to_fetch)} still fresh in cache")
+
+        # Only now is an expired cache unpickled, for its stale positions to stand
+        # in for (and stay cached for) the objects the API didn't return
+        if cache_expired and len(fetched_objects) < len(to_fetch):
+            cached_entries = {entry['state']['name']: entry for entry in self._load_cache_entries() or []}
+
+        # If we got objects, cache them. Other entries, including stale ones whose
+        # refetch failed, are kept until fresh data replaces them.
+        if fetched_objects:
+            timestamp = now.isoformat()
+            new_entries = {}
+            for obj in fetched_objects:
+                new_entries[obj.name] = {
+                    'timestamp': timestamp,
+                    'ttl_hours': self._ttl_hours(obj.type),
+                    # Keyword arguments for CelestialObject, passed straight back on load
+                    'state': {
+                        'name': obj.name,
+                        'type_': obj.type,
+                        'x': obj.x,
+                        'y': obj.y,
+                        'z': obj.z,
+                        'size': obj.size,
+                        'distance': obj.distance,
+                        'vx': obj.vx,
+                        'vy': obj.vy,
+                        'vz': obj.vz,
+                        'parent': obj.parent,
+                    },
+                }
+            self._save_to_cache(list({**cached_entries, **new_entries}.values()))
+
+        # Return fetched objects, falling back to cached (possibly stale) ones,
+        # in definition order
+        fetched_by_name = {obj.name: obj for obj in fetched_objects}
+        from_cache = [
+            cached_entries[obj['name']] for obj in object_definitions
+            if obj['name'] not in fetched_by_name and obj['name'] in cached_entries
+        ]
+        by_name = {obj.name: obj for obj in self._objects_from_cache_entries(from_cache)}
+        by_name.update(fetched_by_name)
+        celestial_objects = [by_name[obj['name']] for obj in object_definitions if obj['name'] in by_name]
+
+        stale = sum(1 for entry in from_cache if not self._is_fresh(entry, now))
+        if stale:
+            logging.warning(f"Using stale cached positions for {stale} objects the API didn't return")
+        if not celestial_objects:
+            logging.error("No cached data available. Cannot load celestial objects.")
+
+        return celestial_objects, stale, len(fetched_objects)
 
     def fetch_with_fallback(self, object_definitions):
         """
@@ -323,18 +375,13 @@ class HorizonsAPIClient:
             object_definitions: List of dicts with name, command, type, size
 
         Returns:
-            Tuple of (List of CelestialObject instances, bool indicating if from cache)
+            Tuple of (List of CelestialObject instances, bool indicating if from
+            cache: True when nothing came from the API, or when stale cached
+            positions stood in for objects it failed to return)
         """
-        # Try to load from cache first to get immediate results
-        cached_objects = self._load_from_cache()
-
-        # Try API
-        api_objects = self.fetch_celestial_objects(object_definitions)
+        # The fetch reads the cache itself and fills in whatever the API doesn't deliver
+        objects, stale, fetched = self._fetch_objects(object_definitions)
 
-        if api_objects:
-            return api_objects, False  # Fresh data from API
-        elif cached_objects:
+        if stale:
             logging.info("Using cached data due to API failure")
-            return cached_objects, True  # Cached data
-        else:
-            return [], False  # No data available
+        return objects, bool(stale) or not fetched
@@ -2,11 +2,55 @@
 NASA DONKI Space Weather API Client.
 Fetches real-time solar flare alerts, CME, and other space weather events.
 """
+import orjson
 import requests
+import itertools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 
+# DONKI data changes over minutes to hours, so responses are reused for a short
+# while. The cache is per process (clients are created per poll), so every run
+# starts empty.
+CACHE_TTL_SECONDS = 300
+_response_cache = {}  # (endpoint, days_back, most_recent) -> (fetched_at, events)
+_response_cache_lock = threading.Lock()
+
+# One keep-alive session for the whole process: the app creates a client per
+# poll, so a per-client session would be used once and leak its pool
+_session = requests.Session()
+
+# Flare classes worth announcing, matched on the first character of classType
+_SIG_CHARS = frozenset('MX')
+
+
+def _cache_get(key):
+    """Return cached events for key, or None if missing or expired."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > CACHE_TTL_SECONDS:
+        return None
+    return entry[1]
+
+
+def _cache_put(key, events):
+    """Store a successful response."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), events)
+
+
+def _format_event_time(timestamp):
+    """Format a DONKI timestamp for speech, or return it unchanged if unparseable."""
+    try:
+        # fromisoformat() accepts DONKI's trailing "Z" on Python 3.11+
+        return f"{datetime.fromisoformat(timestamp):%B %d at %H:%M UTC}"
+    except (TypeError, ValueError):
+        return timestamp
+
+
 class SpaceWeatherClient:
     """Client for NASA DONKI (Database Of Notifications, Knowledge, Information) API."""
 
@@ -20,6 +64,8 @@ class SpaceWeatherClient:
         """
         self.base_url = "https://api.nasa.gov/DONKI"
         self.api_key = api_key
+        # Shared keep-alive session so FLR/CME/GST calls reuse a TLS connection
+        self.session = _session
 
     def get_solar_flares(self, days_back=7, most_recent=False):
         """
@@ -32,6 +78,11 @@ class SpaceWeatherClient:
         Returns:
             List of solar flare events
         """
+        cache_key = ("FLR", days_back, most_recent)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
@@ -46,12 +97,13 @@ class SpaceWeatherClient:
             params["mostRecent"] = "true"
 
         try:
-            response = requests.get(f"{self.base_url}/FLR", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/FLR", params=params, timeout=10)
             response.raise_for_status()
-            flares = response.json()
+            flares = orjson.loads(response.content)
+            _cache_put(cache_key, flares)
             logging.info(f"Fetched {len(flares)} solar flare events")
             return flares
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logging.error(f"Failed to fetch solar flares: {e}")
             return []
 
@@ -66,6 +118,11 @@ class SpaceWeatherClient:
         Returns:
             List of CME events
         """
+        cache_key = ("CME", days_back, most_recent)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
@@ -80,12 +137,13 @@ class SpaceWeatherClient:
             params["mostRecent"] = "true"
 
         try:
-            response = requests.get(f"{self.base_url}/CME", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/CME", params=params, timeout=10)
             response.raise_for_status()
-            cme_events = response.json()
+            cme_events = orjson.loads(response.content)
+            _cache_put(cache_key, cme_events)
             logging.info(f"Fetched {len(cme_events)} CME events")
             return cme_events
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logging.error(f"Failed to fetch CME events: {e}")
             return []
 
@@ -100,6 +158,11 @@ class SpaceWeatherClient:
         Returns:
             List of geomagnetic storm events
         """
+        cache_key = ("GST", days_back, most_recent)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days_back)
 
@@ -114,15 +177,33 @@ class SpaceWeatherClient:
             params["mostRecent"] = "true"
 
         try:
-            response = requests.get(f"{self.base_url}/GST", params=params, timeout=10)
+            response = self.session.get(f"{self.base_url}/GST", params=params, timeout=10)
             response.raise_for_status()
-            storms = response.json()
+            storms = orjson.loads(response.content)
+            _cache_put(cache_key, storms)
             logging.info(f"Fetched {len(storms)} geomagnetic storm events")
             return storms
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             logging.error(f"Failed to fetch geomagnetic storms: {e}")
             return []
 
+    def _fetch_all_events(self, days_back=1, most_recent=False):
+        """
+        Fetch flares, CMEs and geomagnetic storms concurrently.
+
+        Args:
+            days_back: Number of days to look back
+            most_recent: Passed through to each endpoint
+
+        Returns:
+            Tuple of (flares, cme_events, storms) lists
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            flares = executor.submit(self.get_solar_flares, days_back, most_recent)
+            cme_events = executor.submit(self.get_cme_events, days_back, most_recent)
+            storms = executor.submit(self.get_geomagnetic_storms, days_back, most_recent)
+        return flares.result(), cme_events.result(), storms.result()
+
     def get_space_weather_summary(self, days_back=7):
         """
         Get a summary of all space weather events.
@@ -133,16 +214,16 @@ class SpaceWeatherClient:
         Returns:
             Dictionary with counts and recent events
         """
-        flares = self.get_solar_flares(days_back)
-        cme_events = self.get_cme_events(days_back)
-        storms = self.get_geomagnetic_storms(days_back)
+        flares, cme_events, storms = self._fetch_all_events(days_back)
 
-        # Filter for significant events
-        significant_flares = [f for f in flares if f.get('classType', '').startswith(('M', 'X'))]
+        # Count significant events
+        significant_count = sum(
+            1 for f in flares if (ct := f.get('classType')) and ct[0] in _SIG_CHARS
+        )
 
         summary = {
             'flares_total': len(flares),
-            'flares_significant': len(significant_flares),
+            'flares_significant': significant_count,
             'cme_events': len(cme_events),
             'geomagnetic_storms': len(storms),
             'recent_flares': flares[:3] if flares else [],
@@ -166,11 +247,7 @@ class SpaceWeatherClient:
         begin_time = flare.get('beginTime', 'Unknown time')
 
         # Parse time if available
-        try:
-            dt = datetime.fromisoformat(begin_time.replace('Z', '+00:00'))
-            time_str = dt.strftime("%B %d at %H:%M UTC")
-        except:
-            time_str = begin_time
+        time_str = _format_event_time(begin_time)
 
         return f"Solar flare detected: Class {class_type} on {time_str}"
 
@@ -187,11 +264,7 @@ class SpaceWeatherClient:
         activity_time = cme.get('activityTime', 'Unknown time')
 
         # Parse time if available
-        try:
-            dt = datetime.fromisoformat(activity_time.replace('Z', '+00:00'))
-            time_str = dt.strftime("%B %d at %H:%M UTC")
-        except:
-            time_str = activity_time
+        time_str = _format_event_time(activity_time)
 
         return f"Coronal Mass Ejection detected on {time_str}"
 
@@ -205,21 +278,25 @@ class SpaceWeatherClient:
         """
         warnings = []
 
-        # Check for recent significant solar flares (last 24 hours)
+        # All three feeds for the last 24 hours, requested together
         # Use mostRecent=True for real-time efficiency
-        flares = self.get_solar_flares(days_back=1, most_recent=True)
-        significant_flares = [f for f in flares if f.get('classType', '').startswith(('M', 'X'))]
+        flares, cme_events, storms = self._fetch_all_events(days_back=1, most_recent=True)
+
+        # Check for recent significant solar flares
+        # Take the first two significant flares and stop scanning; DONKI lists
+        # events oldest first, so these are the two earliest in the window
+        significant_flares = itertools.islice(
+            (f for f in flares if (ct := f.get('classType')) and ct[0] in _SIG_CHARS), 2
+        )
 
-        for flare in significant_flares[:2]:  # Limit to 2 most recent
+        for flare in significant_flares:
             warnings.append(self.format_flare_announcement(flare))
 
         # Check for recent CME events
-        cme_events = self.get_cme_events(days_back=1, most_recent=True)
         for cme in cme_events[:1]:  # Limit to 1 most recent
             warnings.append(self.format_cme_announcement(cme))
 
         # Check for geomagnetic storms
-        storms = self.get_geomagnetic_storms(days_back=1, most_recent=True)
         if storms:
             storm = storms[0]
             kp_index = storm.get('allKpIndex', [{}])[0].get('kpIndex', 'Unknown')